@@ -1,11 +1,20 @@
 from .domain import task, class_encodings, Dataset, Image, Annotation, AnnotationSet, Bbox, Segment
+from .api import DEFAULT_BULK_SIZE_BYTES, DEFAULT_UPLOAD_CONCURRENCY
 from .sdk import SDK
 from .version import __version__
 
 _sdk = None
 
 
-def connect(server: str = None, email: str = None, password: str = None, viewer: str = None, remo_home: str = None):
+def connect(
+    server: str = None,
+    email: str = None,
+    password: str = None,
+    viewer: str = None,
+    remo_home: str = None,
+    upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+    bulk_size_bytes: int = DEFAULT_BULK_SIZE_BYTES,
+):
     """
     Connect to a remo server.
     If no parameters are passed, it connects to a local running remo server. To connect to a remote remo, specify connection details.
@@ -16,6 +25,8 @@ def connect(server: str = None, email: str = None, password: str = None, viewer:
         password: password used for authentication
         (optional) viewer: viewer to use, one between 'browser', 'electron' and 'jupyter'
         (optional) remo_home: location of remo home
+        (optional) upload_concurrency: number of file bulks uploaded in parallel
+        (optional) bulk_size_bytes: max size of a single upload request, in bytes
     """
 
     from .config import Config, set_remo_home, set_remo_home_from_default_remo_config
@@ -32,7 +43,7 @@ def connect(server: str = None, email: str = None, password: str = None, viewer:
         viewer = config.viewer
 
     global _sdk
-    _sdk = SDK(server, email, password, viewer)
+    _sdk = SDK(server, email, password, viewer, upload_concurrency=upload_concurrency, bulk_size_bytes=bulk_size_bytes)
     if config.public_url:
         _sdk.set_public_url(config.public_url)
     # set access to public SDK methods
@@ -1,42 +1,122 @@
+import asyncio
+import contextlib
 import http
+import io
+import json
 import os
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import timedelta
 import filetype
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
 from urllib.parse import quote
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    from orjson import loads as _loads
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # orjson rejects subclasses of builtin types, e.g. float subclasses, which json accepts
+            return json.dumps(obj).encode()
+
+except ImportError:
+    from json import loads as _loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 from .endpoints import backend
-from .utils import FileResolver
+from .utils import FileResolver, file_extension
+
+DEFAULT_UPLOAD_CONCURRENCY = 6
+DEFAULT_BULK_SIZE_BYTES = 64 * 1024 * 1024
+
+_MIME_BY_EXT = {}
+
+
+def _mime_for(path):
+    """
+    Guesses file mime type, caching the result per file extension
+    """
+    ext = file_extension(path)
+    if ext not in _MIME_BY_EXT:
+        _MIME_BY_EXT[ext] = filetype.guess_mime(path)
+    return _MIME_BY_EXT[ext]
 
 
 class UploadStatus:
     def __init__(self, total_count):
         self.total_count = total_count
         self.current_count = 0
-        self.start = datetime.now()
+        self.start = time.monotonic()
         self.reported_progress = 0
+        self._lock = threading.Lock()
 
     def update(self, count):
-        self.current_count += count
+        with self._lock:
+            self.current_count += count
 
     def progress(self):
-        percentage = int(self.current_count / self.total_count * 100)
-        if percentage > self.reported_progress:
-            elapsed = (datetime.now() - self.start).seconds + 1e-3
+        with self._lock:
+            percentage = self.current_count * 100 // self.total_count
+            if percentage <= self.reported_progress:
+                return
+            self.reported_progress = percentage
+
+            elapsed = time.monotonic() - self.start + 1e-3
             avg_speed = self.current_count / elapsed
-            eta = timedelta(seconds=(self.total_count - self.current_count) / avg_speed)
+            eta = timedelta(seconds=int((self.total_count - self.current_count) / avg_speed))
             print(
                 'Progress {}% - {}/{} - elapsed {} - speed: {} img / s, ETA: {}'.format(
                     percentage,
                     self.current_count,
                     self.total_count,
-                    timedelta(seconds=elapsed),
+                    timedelta(seconds=int(elapsed)),
                     "%.2f" % avg_speed,
                     eta,
                 )
             )
-        self.reported_progress = percentage
+
+
+class UploadWindow:
+    """
+    Limits the amount of bytes and bulks in flight during parallel uploads.
+    The byte limit grows while the smoothed bulk upload speed holds and shrinks one bulk at a time
+    when it drops to less than half of the best recent speed.
+    """
+
+    def __init__(self, target, min_target, max_target, max_bulks):
+        self.target = target
+        self.min_target = min_target
+        self.max_target = max_target
+        self.max_bulks = max_bulks
+        self.speed = None
+        self.best_speed = 0
+
+    def has_room(self, inflight_bytes, inflight_bulks, size):
+        if inflight_bulks == 0:
+            return True
+        return inflight_bulks < self.max_bulks and inflight_bytes + size <= self.target
+
+    def feedback(self, size, elapsed):
+        speed = size / max(elapsed, 1e-3)
+        self.speed = speed if self.speed is None else 0.8 * self.speed + 0.2 * speed
+        if self.speed >= self.best_speed * 0.8:
+            self.target = min(self.target + size, self.max_target)
+        elif self.speed < self.best_speed * 0.5:
+            self.target = max(self.target - size, self.min_target)
+        # the best speed slowly decays, so that an old peak can't keep the window small forever
+        self.best_speed = max(self.best_speed * 0.95, self.speed)
 
 
 class BaseAPI:
@@ -44,11 +124,26 @@ class BaseAPI:
         self.server = server
         self.token = None
         self._public_url = ''
+        self._session = self._create_session()
         self._login(email, password)
 
+    @staticmethod
+    def _create_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False
+            ),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def _login(self, email, password):
         try:
-            resp = requests.post(self.url(backend.login), data={"password": password, "email": email})
+            resp = self._session.post(self.url(backend.login), data={"password": password, "email": email})
         except requests.exceptions.ConnectionError:
             raise Exception('Failed connect to server: {}'.format(self.server))
 
@@ -56,15 +151,11 @@ class BaseAPI:
             raise Exception(resp.json())
 
         self.token = resp.json().get('key')
+        self._session.headers['Authorization'] = 'Token {}'.format(self.token)
 
     def _is_authenticated(self):
         return self.token is not None
 
-    def _auth_header(self):
-        if not self._is_authenticated():
-            raise Exception('Not authenticated')
-        return {'Authorization': 'Token {}'.format(self.token)}
-
     def set_public_url(self, public_url: str):
         self._public_url = public_url
 
@@ -76,13 +167,13 @@ class BaseAPI:
         return self._build_url(self.server, endpoint, *args, **kwargs)
 
     def post(self, *args, **kwargs):
-        return requests.post(*args, headers=self._auth_header(), **kwargs)
+        return self._session.post(*args, **kwargs)
 
     def get(self, *args, **kwargs):
-        return requests.get(*args, headers=self._auth_header(), **kwargs)
+        return self._session.get(*args, **kwargs)
 
     def delete(self, *args, **kwargs):
-        return requests.delete(*args, headers=self._auth_header(), **kwargs)
+        return self._session.delete(*args, **kwargs)
 
     @staticmethod
     def _build_url(*args, **kwargs):
@@ -94,36 +185,50 @@ class BaseAPI:
         :param kwargs: additional query parameters
         :return: full url
         """
-        args = list(filter(lambda arg: arg is not None, args))
-        tail_slash = kwargs.pop('tail_slash', (str(args[-1])[-1] == '/'))
-        url = '/'.join(map(lambda x: str(x).strip('/'), args))
+        args = [arg for arg in args if arg is not None]
+        tail_slash = kwargs.pop('tail_slash', str(args[-1]).endswith('/'))
+        url = '/'.join([str(arg).strip('/') for arg in args])
 
         params = []
         for key, val in kwargs.items():
-            if type(val) is str:
-                if ',' in val:
-                    values = val.split(',')
-                    values = ','.join(map(quote, values))
-                    params.append('{}={}'.format(key, values))
-                else:
-                    params.append('{}={}'.format(key, quote(val)))
-            elif type(val) is list:
-                values = ','.join(map(lambda v: quote(str(v)), val))
-                params.append('{}={}'.format(key, values))
+            if isinstance(val, str):
+                # commas separate multiple values, so they are kept unquoted
+                val = quote(val, safe='/,')
+            elif isinstance(val, list):
+                val = ','.join([quote(str(v)) for v in val])
             elif val:
-                params.append('{}={}'.format(key, val))
+                val = str(val)
+            else:
+                continue
+            params.append(key + '=' + val)
 
-        if len(params):
-            joined_params = "&".join(params)
-            separator = '&' if '?' in url else '/?'
-            url = "{}{}{}".format(url, separator, joined_params)
-        elif '?' not in url and tail_slash:
-            url += '/'
+        if params:
+            return url + ('&' if '?' in url else '/?') + '&'.join(params)
+        if tail_slash and '?' not in url:
+            return url + '/'
 
         return url
 
 
 class API(BaseAPI):
+    def __init__(
+        self,
+        server,
+        email,
+        password,
+        upload_concurrency=DEFAULT_UPLOAD_CONCURRENCY,
+        bulk_size_bytes=DEFAULT_BULK_SIZE_BYTES,
+        max_bytes_inflight=None,
+    ):
+        super().__init__(server, email, password)
+        self.upload_concurrency = upload_concurrency
+        self.bulk_size_bytes = bulk_size_bytes
+        self.max_bytes_inflight = max_bytes_inflight
+
+    def _max_bytes_inflight(self):
+        # by default, enough bytes to keep every upload worker busy
+        return self.max_bytes_inflight or self.upload_concurrency * self.bulk_size_bytes
+
     def create_dataset(self, name):
         return self.post(self.url(backend.dataset), json={"name": name}).json()
 
@@ -155,30 +260,61 @@ class API(BaseAPI):
         self, dataset_id, annotation_set_id, image_id, existing_annotations=None, classes=None, objects=None
     ):
 
-        url = self.url(backend.add_annotation).format(dataset_id, annotation_set_id, image_id)
+        url = self.url(backend.add_annotation(dataset_id, annotation_set_id, image_id))
         existing_annotations = existing_annotations if existing_annotations else []
 
         payload = {}
         if objects:
             # It's object detection
-            payload = {"objects": existing_annotations + objects}
+            payload = {"objects": [*existing_annotations, *objects]}
         elif classes:
             # It's classification
-            payload = {"classes": existing_annotations + classes}
+            payload = {"classes": [*existing_annotations, *classes]}
 
         if payload:
             payload['status'] = 'done'
-            return self.post(url, json=payload).json()
+            return self.post(url, data=_dumps(payload), headers={'Content-Type': 'application/json'}).json()
+
+    def _post_multipart(self, url, files, data):
+        """
+        Streams files from disk as a multipart request body, instead of loading them into memory.
+        File handles are closed as soon as the request is done.
+        """
+        with contextlib.ExitStack() as stack:
+            fields = [
+                ('files', (os.path.basename(path), stack.enter_context(open(path, 'rb')), _mime_for(path)))
+                for path in files
+            ]
+            encoder = MultipartEncoder(fields=fields + list(data.items()))
+            return self.post(url, data=encoder, headers={'Content-Type': encoder.content_type})
 
     def upload_file(self, dataset_id, path, annotation_task=None, folder_id=None):
-        name = os.path.basename(path)
-        files = {'files': (name, open(path, 'rb'), filetype.guess_mime(path))}
         data = {}
         if annotation_task:
             data['annotation_task'] = annotation_task
 
-        url = self.url(backend.dataset_upload.format(dataset_id), folder_id=folder_id)
-        return self.post(url, files=files, data=data).json()
+        url = self.url(backend.dataset_upload(dataset_id), folder_id=folder_id)
+        return self._post_multipart(url, [path], data).json()
+
+    @staticmethod
+    def _upload_form_data(annotation_task=None, class_encoding=None, session_id=None):
+        data = {}
+        if annotation_task:
+            data['annotation_task'] = annotation_task
+        if session_id:
+            data['session_id'] = session_id
+        if isinstance(class_encoding, dict):
+            for key, val in class_encoding.items():
+                data['class_encoding_{}'.format(key)] = val
+        return data
+
+    @staticmethod
+    def _check_upload_response(status_code, json_resp, text, files_to_upload):
+        if (status_code >= http.HTTPStatus.BAD_REQUEST) and ('errors' in json_resp):
+            raise Exception('Error description:' + '\n'.join(json_resp['errors']))
+
+        if status_code != http.HTTPStatus.OK:
+            print('Error - Response:', text, 'files:', files_to_upload)
 
     # TODO: fix progress to include both local files and uploads
     def upload_files(
@@ -192,35 +328,35 @@ class API(BaseAPI):
         class_encoding=None,
         session_id: str = None
     ):
-        files = [
-            ('files', (os.path.basename(path), open(path, 'rb'), filetype.guess_mime(path)))
-            for path in files_to_upload
-        ]
-        data = {}
-        if annotation_task:
-            data['annotation_task'] = annotation_task
-        if session_id:
-            data['session_id'] = session_id
-        if isinstance(class_encoding, dict):
-            for key, val in class_encoding.items():
-                data['class_encoding_{}'.format(key)] = val
+        r = self._post_bulk(
+            dataset_id, files_to_upload, annotation_task, folder_id, annotation_set_id, class_encoding, session_id
+        )
+        return self._complete_bulk(r, files_to_upload, status)
 
+    def _post_bulk(
+        self, dataset_id, files_to_upload, annotation_task, folder_id, annotation_set_id, class_encoding, session_id
+    ):
+        data = self._upload_form_data(annotation_task, class_encoding, session_id)
         url = self.url(
-            backend.dataset_upload.format(dataset_id),
+            backend.dataset_upload(dataset_id),
             folder_id=folder_id,
             annotation_set_id=annotation_set_id,
         )
-        r = self.post(url, files=files, data=data)
-        json_resp = r.json()
-        
-        if (r.status_code >= http.HTTPStatus.BAD_REQUEST) and ('errors' in json_resp):
-            raise Exception('Error description:' + '\n'.join(json_resp['errors']))
-        
-        if r.status_code != http.HTTPStatus.OK:
-            print('Error - Response:', r.text, 'files:', files_to_upload)
+        return self._post_multipart(url, files_to_upload, data)
 
-        status.update(len(files))
-        status.progress()
+    def _post_bulk_timed(self, *args):
+        # timed in the worker, so that waiting in the executor queue doesn't count as upload time
+        started = time.monotonic()
+        r = self._post_bulk(*args)
+        return r, time.monotonic() - started
+
+    def _complete_bulk(self, r, files_to_upload, status):
+        json_resp = _loads(r.content)
+        self._check_upload_response(r.status_code, json_resp, r.text, files_to_upload)
+
+        if status:
+            status.update(len(files_to_upload))
+            status.progress()
         return json_resp
 
     # TODO: fix progress to include both local files and uploads
@@ -232,44 +368,192 @@ class API(BaseAPI):
         folder_id=None,
         annotation_set_id=None,
         class_encoding=None,
-        session_id: str = None
+        session_id: str = None,
+        async_mode: bool = False
     ):
+        if async_mode:
+            if sys.version_info < (3, 7):
+                raise Exception('Async upload requires Python 3.7+')
+            return self._run_coroutine(
+                self.bulk_upload_files_async(
+                    dataset_id, files_to_upload, annotation_task, folder_id, annotation_set_id, class_encoding, session_id
+                )
+            )
 
         # files to upload
         files = FileResolver(files_to_upload, annotation_task or annotation_set_id).resolve()
         groups = self.split_files_by_size(files)
         status = UploadStatus(len(files))
-        with ThreadPoolExecutor(1) as ex:
-            results = ex.map(
-                lambda bulk: self.upload_files(
-                    dataset_id, bulk, annotation_task, folder_id, status, annotation_set_id, class_encoding, session_id
-                ),
-                groups,
-            )
+        if len(groups) <= 1:
+            # no need for a thread pool to upload a single bulk
+            return [
+                self.upload_files(
+                    dataset_id,
+                    [path for path, _ in bulk],
+                    annotation_task,
+                    folder_id,
+                    status,
+                    annotation_set_id,
+                    class_encoding,
+                    session_id,
+                )
+                for bulk in groups
+            ]
+
+        max_bytes_inflight = self._max_bytes_inflight()
+        window = UploadWindow(
+            max_bytes_inflight,
+            min_target=min(self.bulk_size_bytes, max_bytes_inflight),
+            max_target=max_bytes_inflight,
+            max_bulks=self.upload_concurrency,
+        )
+        results = [None] * len(groups)
+        pending = [(i, [path for path, _ in bulk], sum(size for _, size in bulk)) for i, bulk in enumerate(groups)]
+        pending.reverse()
+
+        # upload workers only send bulks, parsing responses and reporting progress is done by a separate pool
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency) as ex, ThreadPoolExecutor(2) as reaper:
+            inflight = {}
+            inflight_bytes = 0
+            completing = set()
+            while pending or inflight:
+                # stop sending more bulks as soon as the server rejects one
+                for future in [f for f in completing if f.done()]:
+                    completing.discard(future)
+                    future.result()
+
+                while pending and window.has_room(inflight_bytes, len(inflight), pending[-1][2]):
+                    i, paths, size = pending.pop()
+                    future = ex.submit(
+                        self._post_bulk_timed,
+                        dataset_id,
+                        paths,
+                        annotation_task,
+                        folder_id,
+                        annotation_set_id,
+                        class_encoding,
+                        session_id,
+                    )
+                    inflight[future] = (i, paths, size)
+                    inflight_bytes += size
+
+                done, _ = wait(set(inflight) | completing, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in inflight:
+                        continue
+                    i, paths, size = inflight.pop(future)
+                    inflight_bytes -= size
+                    r, elapsed = future.result()
+                    window.feedback(size, elapsed)
+                    results[i] = reaper.submit(self._complete_bulk, r, paths, status)
+                    completing.add(results[i])
+
+        return [result.result() for result in results]
+
+    async def bulk_upload_files_async(
+        self,
+        dataset_id,
+        files_to_upload,
+        annotation_task=None,
+        folder_id=None,
+        annotation_set_id=None,
+        class_encoding=None,
+        session_id: str = None
+    ):
+        """
+        Uploads all bulks concurrently with aiohttp. File content is read in the event loop executor,
+        so disk reads overlap with network writes.
+        Requires Python 3.7+ and ``aiohttp`` package to be installed.
+        Usually called through ``bulk_upload_files(..., async_mode=True)``.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise Exception('Async upload requires aiohttp: pip install aiohttp')
 
-        return results
+        files = FileResolver(files_to_upload, annotation_task or annotation_set_id).resolve()
+        groups = self.split_files_by_size(files)
+        status = UploadStatus(len(files))
+        data = self._upload_form_data(annotation_task, class_encoding, session_id)
+        url = self.url(
+            backend.dataset_upload(dataset_id),
+            folder_id=folder_id,
+            annotation_set_id=annotation_set_id,
+        )
+
+        # limits bulks in flight, so that only their files are open at the same time
+        semaphore = asyncio.Semaphore(self.upload_concurrency)
+
+        async def upload(session, bulk):
+            paths = [path for path, _ in bulk]
+            async with semaphore:
+                with contextlib.ExitStack() as stack:
+                    form = aiohttp.FormData()
+                    for path in paths:
+                        form.add_field(
+                            'files',
+                            stack.enter_context(open(path, 'rb')),
+                            filename=os.path.basename(path),
+                            content_type=_mime_for(path),
+                        )
+                    for key, val in data.items():
+                        form.add_field(key, val)
+
+                    async with session.post(url, data=form) as resp:
+                        json_resp = await resp.json(content_type=None)
+                        self._check_upload_response(resp.status, json_resp, await resp.text(), paths)
+
+            status.update(len(paths))
+            status.progress()
+            return json_resp
+
+        connector = aiohttp.TCPConnector(limit=self.upload_concurrency, keepalive_timeout=60)
+        headers = {'Authorization': self._session.headers['Authorization']}
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            return await asyncio.gather(*(upload(session, bulk) for bulk in groups))
+
+    @staticmethod
+    def _run_coroutine(coro):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # an event loop is already running (e.g. in Jupyter), run the coroutine in a separate thread
+        with ThreadPoolExecutor(1) as ex:
+            return ex.submit(asyncio.run, coro).result()
 
     def chunks(self, my_list, chunk_size=2000):
-        groups = []
-        """Yield successive n-sized chunks from l."""
-        for i in range(0, len(my_list), chunk_size):
-            groups.append(my_list[i : i + chunk_size])
+        """Yield successive n-sized chunks from l. Deprecated, not used by the SDK anymore."""
+        warnings.warn(
+            'API.chunks is deprecated and will be removed in the next minor release', DeprecationWarning, stacklevel=2
+        )
+        return (my_list[i : i + chunk_size] for i in range(0, len(my_list), chunk_size))
 
-        return groups
+    def split_files_by_size(self, files_with_sizes, bulk_size=None):
+        """
+        Splits files into bulks of up to bulk_size bytes.
+        A file bigger than bulk_size forms a bulk of its own.
 
-    def split_files_by_size(self, files):
+        Args:
+            files_with_sizes: list of ``(path, size)`` pairs, as returned by :class:`FileResolver`
+            bulk_size: max size of a bulk in bytes. Default: ``bulk_size_bytes`` of the API
+        Returns:
+            list of bulks, each bulk is a list of ``(path, size)`` pairs
+        """
+        bulk_size = bulk_size or self.bulk_size_bytes
         groups = []
         bulk = []
         total_size = 0
-        bulk_size = 8 * 1024 * 1024
-        for path in files:
-            total_size += os.path.getsize(path)
-            bulk.append(path)
-            if total_size >= bulk_size:
+        for path, size in files_with_sizes:
+            if bulk and total_size + size > bulk_size:
                 groups.append(bulk)
                 bulk = []
                 total_size = 0
 
+            total_size += size
+            bulk.append((path, size))
+
         if len(bulk):
             groups.append(bulk)
         return groups
@@ -294,7 +578,7 @@ class API(BaseAPI):
         if session_id:
             payload['session_id'] = session_id
 
-        url = self.url(backend.dataset_upload.format(dataset_id), annotation_set_id=annotation_set_id)
+        url = self.url(backend.dataset_upload(dataset_id), annotation_set_id=annotation_set_id)
         return self.post(url, json=payload).json()
 
     def upload_urls(
@@ -317,7 +601,7 @@ class API(BaseAPI):
         if session_id:
             payload['session_id'] = session_id
 
-        url = self.url(backend.dataset_upload.format(dataset_id), annotation_set_id=annotation_set_id)
+        url = self.url(backend.dataset_upload(dataset_id), annotation_set_id=annotation_set_id)
         return self.post(url, json=payload).json()
 
     def create_new_upload_session(self, dataset_id: int) -> str:
@@ -327,11 +611,11 @@ class API(BaseAPI):
         return data.get('session_id')
 
     def complete_upload_session(self, session_id: str):
-        url = self.url(backend.v1_uploads_complete.format(session_id))
+        url = self.url(backend.v1_uploads_complete(session_id))
         self.post(url)
 
     def get_upload_session_status(self, session_id: str):
-        url = self.url(backend.v1_uploads_status.format(session_id))
+        url = self.url(backend.v1_uploads_status(session_id))
         try:
             return self.get(url).json()
         except:
@@ -342,27 +626,27 @@ class API(BaseAPI):
         return self.get(url).json()
 
     def list_dataset_images(self, dataset_id, limit=None, offset=None):
-        url = self.url(backend.v1_sdk_dataset_images.format(dataset_id), limit=limit, offset=offset)
-        return self.get(url).json()
+        url = self.url(backend.v1_sdk_dataset_images(dataset_id), limit=limit, offset=offset)
+        return _loads(self.get(url).content)
 
     def list_dataset_contents(self, dataset_id, limit=None):
-        url = self.url(backend.v1_dataset_images.format(dataset_id), limit=limit)
-        return self.get(url).json()
+        url = self.url(backend.v1_dataset_images(dataset_id), limit=limit)
+        return _loads(self.get(url).content)
 
     def list_dataset_contents_by_folder(self, dataset_id, folder_id, limit=None):
-        url = self.url(backend.dataset_folder_content.format(dataset_id, folder_id), limit=limit)
-        return self.get(url).json()
+        url = self.url(backend.dataset_folder_content(dataset_id, folder_id), limit=limit)
+        return _loads(self.get(url).content)
 
     def get_dataset(self, id):
         url = self.url(backend.v1_datasets, id, tail_slash=True)
         return self.get(url).json()
 
     def list_annotation_sets(self, dataset_id):
-        url = self.url(backend.v1_dataset_annotation_sets.format(dataset_id))
-        return self.get(url).json()
+        url = self.url(backend.v1_dataset_annotation_sets(dataset_id))
+        return _loads(self.get(url).content)
 
     def get_annotation_set(self, id):
-        url = self.url(backend.v1_annotation_set.format(id))
+        url = self.url(backend.v1_annotation_set(id))
         return self.get(url).json()
 
     def export_annotations(
@@ -381,16 +665,58 @@ class API(BaseAPI):
         Returns:
             annotation file content
         """
+        content = io.BytesIO()
+        with self._export_annotations_request(
+            annotation_set_id, annotation_format, export_coordinates, full_path, export_tags, filter_by_tags
+        ) as resp:
+            for chunk in resp.iter_content(65536):
+                content.write(chunk)
+        return content.getvalue()
+
+    def export_annotations_to_file(
+        self, output_file: str, annotation_set_id: int, annotation_format='json', export_coordinates='pixel', full_path=True, export_tags: bool = True, filter_by_tags: list = None
+    ):
+        """
+        Exports annotations in given format and streams them to output file, without buffering in memory.
+        The output file is only replaced once the whole export has been downloaded.
 
+        Args:
+            output_file: output file to save
+            annotation_set_id: annotation set id
+            annotation_format: can be one of ['json', 'coco', 'csv']. Default: 'json'
+            full_path: if True, appends file path to the filename. uses full image path. Default: True
+            export_coordinates: converts output values to percentage or pixels, can be one of ['pixel', 'percent']. Default: 'pixel'
+            export_tags: if True, exports the tags to a separate CSV file. Default: True
+            filter_by_tags: allows to filter results by tags, can be list or str
+        """
+        with self._export_annotations_request(
+            annotation_set_id, annotation_format, export_coordinates, full_path, export_tags, filter_by_tags
+        ) as resp:
+            if resp.status_code != http.HTTPStatus.OK:
+                raise Exception('Failed to export annotations: {}'.format(resp.text))
+
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_file)))
+            try:
+                with os.fdopen(fd, 'wb') as out_file:
+                    for chunk in resp.iter_content(65536):
+                        out_file.write(chunk)
+                os.replace(temp_path, output_file)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+    def _export_annotations_request(
+        self, annotation_set_id, annotation_format, export_coordinates, full_path, export_tags, filter_by_tags
+    ):
         url = self.url(
-            backend.v1_export_annotations.format(annotation_set_id),
+            backend.v1_export_annotations(annotation_set_id),
             annotation_format=annotation_format,
             export_coordinates=export_coordinates,
             full_path=str(full_path).lower(),
             export_tags=str(export_tags).lower(),
             filter_by_tags=filter_by_tags
         )
-        return self.get(url).content
+        return self.get(url, stream=True)
 
     def get_annotation_info(self, dataset_id, annotation_set_id, image_id):
         """
@@ -401,9 +727,27 @@ class API(BaseAPI):
 
         Returns: annotations info
         """
-        url = self.url(backend.annotation_info.format(dataset_id, annotation_set_id, image_id))
+        url = self.url(backend.annotation_info(dataset_id, annotation_set_id, image_id))
         return self.get(url).json()
 
+    def get_annotation_info_bulk(self, dataset_id, annotation_set_id, image_ids):
+        """
+        Fetches annotations info for many images concurrently.
+        Use it instead of calling :meth:`get_annotation_info` in a loop.
+
+        Args:
+            dataset_id: dataset id
+            annotation_set_id: annotation set id
+            image_ids: list of image ids
+
+        Returns: list of annotations info, in the same order as image_ids
+        """
+        urls = [
+            self.url(backend.annotation_info(dataset_id, annotation_set_id, image_id))
+            for image_id in image_ids
+        ]
+        return self.get_many(urls)
+
     def list_annotation_set_classes(self, annotation_set_id: int):
         """
         Lists annotation set classes
@@ -413,7 +757,7 @@ class API(BaseAPI):
 
         Returns: list of classes
         """
-        url = self.url(backend.annotation_set.format(annotation_set_id))
+        url = self.url(backend.annotation_set(annotation_set_id))
         json_data = self.get(url).json()
         return json_data.get('classes', [])
 
@@ -424,6 +768,38 @@ class API(BaseAPI):
         url = self.url(backend.v1_sdk_images, image_id, tail_slash=True)
         return self.get(url).json()
 
+    def list_images_bulk(self, image_ids):
+        """
+        Fetches many images concurrently.
+        Use it instead of calling :meth:`get_image` in a loop.
+
+        Args:
+            image_ids: list of image ids
+
+        Returns: list of images, in the same order as image_ids
+        """
+        urls = [self.url(backend.v1_sdk_images, image_id, tail_slash=True) for image_id in image_ids]
+        return self.get_many(urls)
+
+    def get_many(self, urls):
+        """
+        Issues GET requests concurrently, reusing connections from the session pool
+
+        Args:
+            urls: list of urls
+
+        Returns: list of json responses, in the same order as urls
+        """
+        if len(urls) <= 1:
+            return [self.get(url).json() for url in urls]
+
+        results = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency) as ex:
+            futures = {ex.submit(self.get, url): i for i, url in enumerate(urls)}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result().json()
+        return results
+
     def search_images(self, classes=None, task=None, dataset_id=None, limit=None):
         """
         Search images given a list of classes and tasks
@@ -446,7 +822,7 @@ class API(BaseAPI):
             params['limit'] = limit
 
         url = self.url(backend.v1_search, **params)
-        return self.get(url).json()['results']
+        return _loads(self.get(url).content)['results']
 
     def delete_dataset(self, dataset_id: int):
         """
@@ -455,5 +831,5 @@ class API(BaseAPI):
         Args:
             dataset_id: dataset id
         """
-        url = self.url(backend.delete_dataset.format(dataset_id))
+        url = self.url(backend.delete_dataset(dataset_id))
         self.delete(url)
@@ -133,7 +133,7 @@ class AnnotationSet:
             self.id,
             annotation_format=annotation_format,
             export_coordinates=export_coordinates,
-            full_path=full_path,
+            append_path=full_path,
             export_tags=export_tags,
             filter_by_tags=filter_by_tags
         )
@@ -162,7 +162,7 @@ class AnnotationSet:
             output_file,
             self.id,
             annotation_format=annotation_format,
-            full_path=full_path,
+            append_path=full_path,
             export_coordinates=export_coordinates,
             export_tags=export_tags,
             filter_by_tags=filter_by_tags
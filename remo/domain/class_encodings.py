@@ -40,7 +40,8 @@ def for_upload(class_encoding):
     if isinstance(class_encoding, dict):
         if 'local_path' in class_encoding:
             local_path = class_encoding.pop('local_path')
-            class_encoding['raw_content'] = ''.join(open(local_path).readlines())
+            with open(local_path) as f:
+                class_encoding['raw_content'] = f.read()
             return class_encoding
 
         if 'classes' in class_encoding:
@@ -266,7 +266,7 @@ Annotation Sets: {n_annotation_sets}""".format(
             return annotation_set.export_annotations(
                 annotation_format=annotation_format,
                 export_coordinates=export_coordinates,
-                append_path=append_path,
+                full_path=append_path,
                 export_tags=export_tags,
                 filter_by_tags=filter_by_tags
             )
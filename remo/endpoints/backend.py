@@ -1,26 +1,101 @@
 # Backend endpoints
+# Endpoints with path parameters are functions, to avoid parsing format templates on every call
 
 login = '/api/rest-auth/login/'
 dataset = '/api/dataset/'
-delete_dataset = '/api/user-dataset/{}/'
-dataset_upload = '/api/dataset/{}/upload/'
-dataset_folder_content = '/api/user-dataset/{}/contents/{}/'
 v1_uploads = '/api/v1/ui/uploads/'
-v1_uploads_status = '/api/v1/ui/uploads/{}/status/'
-v1_uploads_complete = '/api/v1/ui/uploads/{}/complete/'
 v1_datasets = '/api/v1/ui/datasets/'
-v1_dataset_annotation_sets = '/api/v1/ui/datasets/{}/annotation-sets/'
-v1_dataset_image_annotations = '/api/v1/ui/datasets/{}/images/{}/annotations/'
-v1_dataset_images = '/api/v1/ui/datasets/{}/images/'
-v1_sdk_dataset_images = '/api/v1/sdk/datasets/{}/images/'
 v1_sdk_images = '/api/v1/sdk/images/'
-v1_annotation_set = '/api/v1/ui/annotation-sets/{}/'
-v1_export_annotations = '/api/v1/ui/annotation-sets/{}/export/'
 v1_search = '/api/v1/ui/search/'
-v1_search_images = '/api/v1/ui/search/?classes={}&tasks={}&dataset_id={}'
-v1_search_class = '/api/v1/ui/search/?classes={}'
-v1_search_task = '/api/v1/ui/search/?tasks={}'
-annotation_set = 'api/annotation-set/{}/'
-add_annotation = '/api/dataset/{}/annotation-set/{}/image/{}/save-annotation/'
 v1_create_annotation_set = '/api/v1/ui/annotation-sets/'
-annotation_info = '/api/dataset/{}/annotation-set/{}/image/{}/annotation/'
+
+
+def delete_dataset(dataset_id):
+    return '/api/user-dataset/' + str(dataset_id) + '/'
+
+
+def dataset_upload(dataset_id):
+    return '/api/dataset/' + str(dataset_id) + '/upload/'
+
+
+def dataset_folder_content(dataset_id, folder_id):
+    return '/api/user-dataset/' + str(dataset_id) + '/contents/' + str(folder_id) + '/'
+
+
+def v1_uploads_status(session_id):
+    return '/api/v1/ui/uploads/' + str(session_id) + '/status/'
+
+
+def v1_uploads_complete(session_id):
+    return '/api/v1/ui/uploads/' + str(session_id) + '/complete/'
+
+
+def v1_dataset_annotation_sets(dataset_id):
+    return '/api/v1/ui/datasets/' + str(dataset_id) + '/annotation-sets/'
+
+
+def v1_dataset_image_annotations(dataset_id, image_id):
+    return '/api/v1/ui/datasets/' + str(dataset_id) + '/images/' + str(image_id) + '/annotations/'
+
+
+def v1_dataset_images(dataset_id):
+    return '/api/v1/ui/datasets/' + str(dataset_id) + '/images/'
+
+
+def v1_sdk_dataset_images(dataset_id):
+    return '/api/v1/sdk/datasets/' + str(dataset_id) + '/images/'
+
+
+def v1_annotation_set(annotation_set_id):
+    return '/api/v1/ui/annotation-sets/' + str(annotation_set_id) + '/'
+
+
+def v1_export_annotations(annotation_set_id):
+    return '/api/v1/ui/annotation-sets/' + str(annotation_set_id) + '/export/'
+
+
+def v1_search_images(classes, tasks, dataset_id):
+    return (
+        '/api/v1/ui/search/?classes='
+        + str(classes)
+        + '&tasks='
+        + str(tasks)
+        + '&dataset_id='
+        + str(dataset_id)
+    )
+
+
+def v1_search_class(classes):
+    return '/api/v1/ui/search/?classes=' + str(classes)
+
+
+def v1_search_task(tasks):
+    return '/api/v1/ui/search/?tasks=' + str(tasks)
+
+
+def annotation_set(annotation_set_id):
+    return 'api/annotation-set/' + str(annotation_set_id) + '/'
+
+
+def add_annotation(dataset_id, annotation_set_id, image_id):
+    return (
+        '/api/dataset/'
+        + str(dataset_id)
+        + '/annotation-set/'
+        + str(annotation_set_id)
+        + '/image/'
+        + str(image_id)
+        + '/save-annotation/'
+    )
+
+
+def annotation_info(dataset_id, annotation_set_id, image_id):
+    return (
+        '/api/dataset/'
+        + str(dataset_id)
+        + '/annotation-set/'
+        + str(annotation_set_id)
+        + '/image/'
+        + str(image_id)
+        + '/annotation/'
+    )
@@ -4,7 +4,7 @@ from typing import List
 import csv
 
 from .domain import Image, Dataset, AnnotationSet, class_encodings, Annotation
-from .api import API
+from .api import API, DEFAULT_BULK_SIZE_BYTES, DEFAULT_UPLOAD_CONCURRENCY
 
 from .endpoints import frontend
 from .viewer import factory
@@ -20,6 +20,8 @@ class SDK:
         password: user credentials
         viewer: allows to choose between browser, electron and jupyter viewer.
             To be able change viewer, you can use :func:`set_viewer` function. See example.
+        upload_concurrency: number of file bulks uploaded in parallel
+        bulk_size_bytes: max size of a single upload request, in bytes
 
     Example::
 
@@ -29,8 +31,18 @@ class SDK:
 
     """
 
-    def __init__(self, server: str, email: str, password: str, viewer: str = 'browser'):
-        self.api = API(server, email, password)
+    def __init__(
+        self,
+        server: str,
+        email: str,
+        password: str,
+        viewer: str = 'browser',
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        bulk_size_bytes: int = DEFAULT_BULK_SIZE_BYTES,
+    ):
+        self.api = API(
+            server, email, password, upload_concurrency=upload_concurrency, bulk_size_bytes=bulk_size_bytes
+        )
 
         self.viewer = None
         self.set_viewer(viewer)
@@ -449,15 +461,17 @@ class SDK:
             export_tags: if True, exports also all the tags to a CSV file. Default: True
             filter_by_tags: allows to filter results by tags, can be list or str
         """
-        content = self.export_annotations(
+        output_file = self._resolve_path(output_file)
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        self.api.export_annotations_to_file(
+            output_file,
             annotation_set_id,
             annotation_format=annotation_format,
             export_coordinates=export_coordinates,
-            append_path=append_path,
+            full_path=append_path,
             export_tags=export_tags,
             filter_by_tags=filter_by_tags
         )
-        self._save_to_file(content, output_file)
 
     def _save_to_file(self, content: bytes, output_file: str):
         output_file = self._resolve_path(output_file)
@@ -710,6 +724,29 @@ class SDK:
 
         return Image(**json_data)
 
+    def get_images(self, image_ids: List[int]) -> List[Image]:
+        """
+        Retrieves many images at once, fetching them concurrently.
+        Prefer it over calling :func:`get_image` in a loop.
+
+        Args:
+            image_ids: list of image ids
+
+        Returns:
+            List[:class:`remo.Image`]
+        """
+        images = []
+        for image_id, json_data in zip(image_ids, self.api.list_images_bulk(image_ids)):
+            if 'error' in json_data:
+                raise Exception(
+                    'Failed to get image by ID = {}. Error message:\n: {}'.format(
+                        image_id, json_data.get('error')
+                    )
+                )
+            images.append(Image(**json_data))
+
+        return images
+
     def search_images(
         self, classes=None, task: str = None, dataset_id: int = None, limit: int = None,
     ):
@@ -1,4 +1,6 @@
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Tuple
 
 IMAGE_EXTENSIONS = {'.jpeg', '.jpg', '.png', '.tiff', '.tif'}
 ANNOTATION_EXTENSIONS = {'.csv', '.xml', '.json'}
@@ -32,15 +34,45 @@ def resolve_path(path):
     return os.path.realpath(os.path.abspath(path))
 
 
+def scan_dir(path):
+    """
+    Lists a single directory
+
+    Returns:
+        list of ``(path, size)`` pairs for files, and list of subdirectories
+    """
+    files, subdirs = [], []
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return files, subdirs
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                files.append((entry.path, entry.stat().st_size))
+        except OSError:
+            # file was removed or can't be read, skip it
+            continue
+    return files, subdirs
+
+
 class FileResolver:
-    def __init__(self, files, with_annotations=False):
-        self.images = set()
-        self.annotations = set()
-        self.archives = set()
+    def __init__(self, files, with_annotations=False, max_workers=8):
+        self.images = {}
+        self.annotations = {}
+        self.archives = {}
         self.files = files
         self.with_annotations = with_annotations
+        self.max_workers = max_workers
 
-    def resolve(self) -> []:
+    def resolve(self) -> List[Tuple[str, int]]:
+        """
+        Resolves files and directories into a list of ``(path, size)`` pairs.
+        File sizes are taken from the directory scan, so no extra stat calls are needed later.
+        """
         for path in self.files:
             if os.path.isfile(path):
                 self._check_file(path)
@@ -48,9 +80,9 @@ class FileResolver:
             if os.path.isdir(path):
                 self._check_dir(path)
 
-        return list(self.images) + list(self.annotations) + list(self.archives)
+        return list(self.images.items()) + list(self.annotations.items()) + list(self.archives.items())
 
-    def _check_file(self, path):
+    def _check_file(self, path, size=None):
         path = resolve_path(path)
         if not os.path.exists(path):
             return
@@ -62,19 +94,28 @@ class FileResolver:
         if not self.with_annotations and is_annotation_file(name):
             return
 
+        if size is None:
+            size = os.path.getsize(path)
+
         if is_image_file(name):
-            self.images.add(path)
+            self.images[path] = size
             return
 
         if self.with_annotations and is_annotation_file(name):
-            self.annotations.add(path)
+            self.annotations[path] = size
             return
 
         if is_archive_file(name):
-            self.archives.add(path)
+            self.archives[path] = size
 
     def _check_dir(self, path):
-        for dirpath, _, filenames in os.walk(path):
-            for name in filenames:
-                file_path = os.path.join(dirpath, name)
-                self._check_file(file_path)
+        # subdirectories are scanned in parallel, which helps on deep trees and network drives
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            pending = {ex.submit(scan_dir, path)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    pending.update(ex.submit(scan_dir, subdir) for subdir in subdirs)
+                    for file_path, size in files:
+                        self._check_file(file_path, size)
@@ -13,7 +13,12 @@ setup(
     install_requires=[
         'filetype>=1.0.5',
         'requests>=2.21.0',
+        'requests-toolbelt>=0.9.1',
     ],
+    extras_require={
+        'orjson': ['orjson>=3.0'],
+        'async': ['aiohttp>=3.6'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
 